@@ -9,6 +9,7 @@
 py_executables=()
 py_executables+=("download_words:wordle_solver.main.download_words:main")
 py_executables+=("cli:wordle_solver.cli:main")
+py_executables+=("rank_openers:wordle_solver.main.rank_openers:main")
 
 
 ##########################
@@ -10,13 +10,8 @@ from wordle_solver.language.lexicon_strategies import (
     RandomWordSelectStrategy,
     WordleGuessFilterStrategy,
 )
-from wordle_solver.wordle.wordle_guess import WordleGuess
-
-# Number of attempts in a Wordle game.
-TOTAL_ATTEMPTS: int = 6
-
-# Default word length for Wordle.
-WORD_LENGTH: int = 5
+from wordle_solver.wordle.constants import TOTAL_ATTEMPTS, WORD_LENGTH
+from wordle_solver.wordle.wordle_guess import CompactWordleGuess
 
 # Values of confirmation and negation.
 CONFIRM_OPTIONS = {"y", "yes"}
@@ -56,7 +51,7 @@ def reduce_lexicon() -> str:
     """
     # Get a representation of the guess to help filtering.
     raw_user_text = input(f"Enter feedback on line below:")
-    guess = WordleGuess.from_user_input(raw_user_text)
+    guess = CompactWordleGuess.from_user_input(raw_user_text)
 
     # Now do filtering.
     pre_size = lexicon.length
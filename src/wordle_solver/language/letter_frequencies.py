@@ -0,0 +1,107 @@
+"""Letter frequency tables used for heuristic word scoring."""
+
+import heapq
+from collections import Counter, defaultdict
+from operator import neg
+from typing import DefaultDict, Dict, Iterable, Set, Tuple
+
+
+class LetterFrequencies:
+    """Overall and positional letter counts over a collection of words.
+
+    The overall table counts how many words contain a letter (repeats within a
+    word are only counted once), while the positional table counts how many
+    words have a letter at a given index.
+
+    Scores of counted words are cached. Subtracting words only lowers scores,
+    so cached scores stay upper bounds until words are added again, which lets
+    best_word rescore just the few words that could still come out on top.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        """Builds the tables from an initial collection of words.
+
+        :param words: words to count letters over
+        """
+        self.overall: Counter = Counter()
+        self.positional: DefaultDict[int, Counter] = defaultdict(Counter)
+        self._letters: Dict[str, Tuple[str, ...]] = {}
+        self._bounds: Dict[str, int] = {}
+        self.add(words)
+
+    def add(self, words: Iterable[str]) -> None:
+        """Adds the letters of the given words to the tables.
+
+        :param words: words to add
+        :return: None
+        """
+        for word in words:
+            self.overall.update(self._distinct_letters(word))
+            for i, letter in enumerate(word):
+                self.positional[i][letter] += 1
+            self._bounds[word] = 0
+
+        # Scores may have gone up, so cached bounds must be recomputed.
+        for word in self._bounds:
+            self._bounds[word] = self.score(word)
+
+    def subtract(self, words: Iterable[str]) -> None:
+        """Removes the letters of the given words from the tables.
+
+        :param words: words to remove, which must have been added previously
+        :return: None
+        """
+        for word in words:
+            self.overall.subtract(self._distinct_letters(word))
+            for i, letter in enumerate(word):
+                self.positional[i][letter] -= 1
+            self._bounds.pop(word, None)
+
+    def score(self, word: str) -> int:
+        """Scores a word by how common its letters are.
+
+        :param word: word to score
+        :return: sum of overall counts of distinct letters plus positional counts
+        """
+        overall, positional = self.overall, self.positional
+        score = 0
+        for letter in self._distinct_letters(word):
+            score += overall[letter]
+        for i, letter in enumerate(word):
+            score += positional[i][letter]
+        return score
+
+    def best_word(self, words: Set[str]) -> str:
+        """Finds the highest scoring word, breaking ties alphabetically.
+
+        :param words: words to choose from
+        :return: the chosen word
+        """
+        bounds = self._bounds
+        for word in words - bounds.keys():
+            bounds[word] = self.score(word)
+
+        # Pop words by their upper bound until none can beat the best exact score.
+        heap = list(zip(map(neg, map(bounds.__getitem__, words)), words))
+        heapq.heapify(heap)
+        best = ""
+        best_score = -1
+        while heap and -heap[0][0] >= best_score:
+            _, word = heapq.heappop(heap)
+            score = bounds[word] = self.score(word)
+            if score > best_score or (score == best_score and word < best):
+                best, best_score = word, score
+        if best_score < 0:
+            raise ValueError("cannot select a word from an empty set")
+        return best
+
+    def _distinct_letters(self, word: str) -> Tuple[str, ...]:
+        """Determines the distinct letters of a word, caching the result.
+
+        :param word: word to split into letters
+        :return: each letter of the word once
+        """
+        letters = self._letters.get(word)
+        if letters is None:
+            letters = self._letters[word] = tuple(set(word))
+        return letters
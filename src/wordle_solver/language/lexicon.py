@@ -1,9 +1,10 @@
 """Abstraction of the English language."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from string import ascii_lowercase
 from typing import Set
 
+from wordle_solver.language.letter_frequencies import LetterFrequencies
 from wordle_solver.language.lexicon_strategies import FilterStrategy, WordSelectStrategy
 
 # Set of all lowercase English letters.
@@ -15,6 +16,11 @@ class EnglishLexicon:
     """A searchable representation of the English language."""
 
     words: Set[str]
+    frequencies: LetterFrequencies = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Counts letter frequencies over the initial words."""
+        self.frequencies = LetterFrequencies(self.words)
 
     @property
     def length(self) -> int:
@@ -52,7 +58,9 @@ class EnglishLexicon:
         :param filter_strategy: strategy for filtering words
         :return: None
         """
-        self.words = filter_strategy.filter(set(self.words))
+        remaining_words = filter_strategy.filter(set(self.words))
+        self.frequencies.subtract(self.words - remaining_words)
+        self.words = remaining_words
 
     def discard(self, word: str) -> bool:
         """Removes a word from the lexicon.
@@ -63,5 +71,6 @@ class EnglishLexicon:
         """Returns true if word is in lexicon."""
         if word in self.words:
             self.words.discard(word)
+            self.frequencies.subtract([word])
             return True
         return False
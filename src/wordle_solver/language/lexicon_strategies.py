@@ -1,11 +1,13 @@
 """Strategies for working with data contained in lexicons."""
 
+import json
 import random
 from abc import ABC, abstractmethod
 from collections import Counter
 from typing import Set
 
-from wordle_solver.wordle.wordle_guess import WordleGuess, WordleGuessComponentType
+from wordle_solver.language.letter_frequencies import LetterFrequencies
+from wordle_solver.wordle.wordle_guess import AnyWordleGuess, WordleGuessComponentType
 
 
 class WordSelectStrategy(ABC):
@@ -20,6 +22,23 @@ class WordSelectStrategy(ABC):
         """
         ...
 
+    def cache_key(self) -> str:
+        """Identifies the strategy and the parameters deciding its selections.
+
+        By default this is the class name and every attribute, which must all be
+        strings, numbers, booleans or None. Strategies with other attributes
+        must override this rather than have them silently left out.
+
+        :return: key identifying the strategy
+        """
+        params = vars(self)
+        for name, value in params.items():
+            if not isinstance(value, (str, int, float, bool, type(None))):
+                raise ValueError(
+                    f"{type(self).__name__}.{name} cannot be part of a cache key"
+                )
+        return f"{type(self).__name__}:{json.dumps(params, sort_keys=True)}"
+
 
 class RandomWordSelectStrategy(WordSelectStrategy):
     """Selects a word randomly."""
@@ -33,6 +52,40 @@ class RandomWordSelectStrategy(WordSelectStrategy):
         return random.choice(tuple(words))
 
 
+class LetterFrequencyWordSelectStrategy(WordSelectStrategy):
+    """Selects the word whose letters are most common among the candidates.
+
+    The frequency tables are shared with (and kept up to date by) the lexicon,
+    so selection never recounts letters and stays cheap enough to serve as a
+    fallback when heavier strategies are too slow.
+    """
+
+    def __init__(self, frequencies: LetterFrequencies):
+        """Creates a strategy which scores words with the given tables.
+
+        :param frequencies: letter frequencies of the remaining candidates
+        """
+        self.frequencies: LetterFrequencies = frequencies
+
+    def select(self, words: Set[str]) -> str:
+        """Selects the highest scoring word, breaking ties alphabetically.
+
+        :param words: a set of words
+        :return: a word from the set
+        """
+        return self.frequencies.best_word(words)
+
+    def cache_key(self) -> str:
+        """Identifies the strategy, which has no parameters.
+
+        The frequency tables track the remaining candidates rather than
+        configure the strategy, so they are not part of the key.
+
+        :return: key identifying the strategy
+        """
+        return f"{type(self).__name__}:{{}}"
+
+
 class FilterStrategy(ABC):
     """Filters a lexicon."""
 
@@ -134,12 +187,12 @@ class IncorrectLetterFilterStrategy(FilterStrategy):
 class WordleGuessFilterStrategy(FilterStrategy):
     """Filters using a Wordle guess."""
 
-    def __init__(self, wordle_guess: WordleGuess):
+    def __init__(self, wordle_guess: AnyWordleGuess):
         """Creates filter which will use the given Wordle guess
 
-        :param wordle_guess: WordleGuess to filter by
+        :param wordle_guess: WordleGuess or CompactWordleGuess to filter by
         """
-        self.wordle_guess: WordleGuess = wordle_guess
+        self.wordle_guess: AnyWordleGuess = wordle_guess
 
     def filter(self, words: Set[str]) -> Set[str]:
         """Filters words by using a WordleGuess.
@@ -0,0 +1,232 @@
+"""Disk-backed cache of suggested words, shared between processes."""
+
+import hashlib
+import sqlite3
+import time
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+from wordle_solver.language.lexicon_strategies import WordSelectStrategy
+from wordle_solver.wordle.wordle_guess import AnyWordleGuess
+
+# A cache entry: word list hash, strategy key, history key and suggested word.
+CacheEntry = Tuple[str, str, str, str]
+
+
+def words_key(words: Iterable[str]) -> str:
+    """Hashes a word list independently of its order.
+
+    :param words: words in the initial lexicon
+    :return: hex digest identifying the word list
+    """
+    return hashlib.sha256("\n".join(sorted(words)).encode()).hexdigest()
+
+
+def history_key(history: Sequence[AnyWordleGuess]) -> str:
+    """Formats feedback history canonically, one guess per line.
+
+    :param history: feedback given so far, oldest first
+    :return: key identifying the history
+    """
+    return "\n".join(guess.to_user_input() for guess in history)
+
+
+class SuggestionCache:
+    """Maps a word list, strategy and feedback history to a suggested word.
+
+    Entries are stored in SQLite in WAL mode, so any number of processes can
+    read while one writes. Reads never write, which keeps them concurrent, so
+    entries are evicted oldest first rather than least recently used.
+
+    Limits are enforced by every write against the shared database, using a
+    row count kept up to date by triggers, so they hold across any number of
+    processes however short-lived they are.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        timeout: float = 30.0,
+    ):
+        """Opens (creating if needed) the cache at the given path.
+
+        :param file_path: path to the SQLite database
+        :param ttl_seconds: how long entries stay valid, or None to never expire
+        :param max_entries: number of entries to keep, or None for no limit
+        :param timeout: seconds to wait for other writers to release their lock
+        """
+        self.ttl_seconds: Optional[float] = ttl_seconds
+        self.max_entries: Optional[int] = max_entries
+
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            file_path, timeout=timeout, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction():
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS suggestions ("
+                "words_hash TEXT NOT NULL, strategy TEXT NOT NULL, "
+                "history TEXT NOT NULL, word TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "PRIMARY KEY (words_hash, strategy, history))"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS suggestions_created_at "
+                "ON suggestions (created_at)"
+            )
+
+            # Counting rows takes a full scan, so the count is kept in its own table.
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS suggestion_count (count INTEGER NOT NULL)"
+            )
+            self.connection.execute(
+                "INSERT INTO suggestion_count SELECT COUNT(*) FROM suggestions "
+                "WHERE NOT EXISTS (SELECT 1 FROM suggestion_count)"
+            )
+            self.connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS suggestions_insert AFTER INSERT "
+                "ON suggestions BEGIN "
+                "UPDATE suggestion_count SET count = count + 1; END"
+            )
+            self.connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS suggestions_delete AFTER DELETE "
+                "ON suggestions BEGIN "
+                "UPDATE suggestion_count SET count = count - 1; END"
+            )
+        self.evict()
+
+    def get(self, words_hash: str, strategy: str, history: str) -> Optional[str]:
+        """Looks up a suggestion.
+
+        :param words_hash: key of the initial word list
+        :param strategy: key of the strategy
+        :param history: key of the feedback history
+        :return: the suggested word, or None if missing or expired
+        """
+        row = self.connection.execute(
+            "SELECT word FROM suggestions WHERE words_hash = ? AND strategy = ? "
+            "AND history = ? AND created_at >= ?",
+            (words_hash, strategy, history, self._oldest_valid()),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, words_hash: str, strategy: str, history: str, word: str) -> None:
+        """Stores a suggestion, replacing any existing one.
+
+        :param words_hash: key of the initial word list
+        :param strategy: key of the strategy
+        :param history: key of the feedback history
+        :param word: the suggested word
+        :return: None
+        """
+        self.preload([(words_hash, strategy, history, word)])
+
+    def preload(self, entries: Iterable[CacheEntry]) -> int:
+        """Stores many suggestions in a single transaction.
+
+        :param entries: word list hash, strategy, history and word of each entry
+        :return: number of entries stored
+        """
+        now = time.time()
+        with self._transaction():
+            # An upsert rather than a replace, since replacing does not fire
+            # the delete trigger keeping the row count.
+            count = self.connection.executemany(
+                "INSERT INTO suggestions VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (words_hash, strategy, history) DO UPDATE SET "
+                "word = excluded.word, created_at = excluded.created_at",
+                ((*entry, now) for entry in entries),
+            ).rowcount
+            self._evict()
+        return count
+
+    def evict(self) -> int:
+        """Removes expired entries, then the oldest ones beyond the size limit.
+
+        :return: number of entries removed
+        """
+        with self._transaction():
+            return self._evict()
+
+    def count(self) -> int:
+        """Counts the entries in the cache, including expired ones not yet removed.
+
+        :return: number of entries
+        """
+        row = self.connection.execute("SELECT count FROM suggestion_count").fetchone()
+        return row[0]
+
+    def suggest(
+        self,
+        words_hash: str,
+        strategy: WordSelectStrategy,
+        history: Sequence[AnyWordleGuess],
+        words: Set[str],
+    ) -> str:
+        """Returns the cached suggestion, selecting and caching one if missing.
+
+        :param words_hash: key of the initial word list (see words_key)
+        :param strategy: strategy used to select a word on a miss, keyed by its
+            cache_key
+        :param history: feedback given so far, oldest first
+        :param words: remaining words, which the strategy selects from
+        :return: the suggested word
+        """
+        keys = (words_hash, strategy.cache_key(), history_key(history))
+        word = self.get(*keys)
+        if word is None:
+            word = strategy.select(words)
+            self.put(*keys, word)
+        return word
+
+    def close(self) -> None:
+        """Closes the connection to the database.
+
+        :return: None
+        """
+        self.connection.close()
+
+    def __enter__(self) -> "SuggestionCache":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _oldest_valid(self) -> float:
+        """Determines the creation time of the oldest unexpired entry.
+
+        :return: timestamp, which is 0 when entries never expire
+        """
+        if self.ttl_seconds is None:
+            return 0.0
+        return time.time() - self.ttl_seconds
+
+    def _evict(self) -> int:
+        """Evicts entries within an already started write transaction.
+
+        :return: number of entries removed
+        """
+        removed = 0
+        if self.ttl_seconds is not None:
+            removed += self.connection.execute(
+                "DELETE FROM suggestions WHERE created_at < ?", (self._oldest_valid(),)
+            ).rowcount
+        if self.max_entries is not None:
+            excess = self.count() - self.max_entries
+            if excess > 0:
+                removed += self.connection.execute(
+                    "DELETE FROM suggestions WHERE rowid IN (SELECT rowid FROM "
+                    "suggestions ORDER BY created_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        return removed
+
+    def _transaction(self) -> sqlite3.Connection:
+        """Begins a write transaction, committed or rolled back by the context.
+
+        :return: the connection, used as a context manager
+        """
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
@@ -0,0 +1,289 @@
+"""Script for ranking every first guess by the average length of a full game.
+
+Openers are split into shards which are played in worker processes and saved
+to a shared directory as they finish, so a crashed job can be resumed and
+several machines can work on the same directory (each taking every n-th
+shard). Once all shards are done they are merged into a ranked table.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+from multiprocessing import Pool
+from os import path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from wordle_solver.language.lexicon import EnglishLexicon
+from wordle_solver.language.lexicon_strategies import (
+    LengthFilterStrategy,
+    LetterFrequencyWordSelectStrategy,
+    WordleGuessFilterStrategy,
+)
+from wordle_solver.wordle.constants import TOTAL_ATTEMPTS, WORD_LENGTH
+from wordle_solver.wordle.wordle_guess import CompactWordleGuess
+
+# Set logger for module.
+logger = logging.getLogger("rank_openers")
+
+# Default word lists, relative to this file.
+CONTAINING_DIRECTORY = path.dirname(path.abspath(__file__))
+SHORT_WORDS_PATH = path.join(CONTAINING_DIRECTORY, "../data/short_words.txt")
+LONG_WORDS_PATH = path.join(CONTAINING_DIRECTORY, "../data/long_words.txt")
+
+# Name of the file describing the job a directory of shards belongs to.
+JOB_FILE_NAME = "job.json"
+
+# Words available to worker processes, set once per process by _init_worker.
+_answers: Tuple[str, ...] = ()
+
+
+def play_game(opener: str, answer: str, answers: Sequence[str]) -> int:
+    """Plays a game, following up the opener with letter frequency guesses.
+
+    :param opener: the first guess
+    :param answer: the hidden word
+    :param answers: words which may be the hidden word
+    :return: number of guesses needed to find the answer
+    """
+    if opener == answer:
+        return 1
+
+    # Counting letters over the opener's survivors is cheaper than counting over
+    # every answer and then subtracting the words it rules out.
+    opener_filter = WordleGuessFilterStrategy(
+        CompactWordleGuess.from_answer(opener, answer)
+    )
+    lexicon = EnglishLexicon(opener_filter.filter(set(answers)))
+    lexicon.discard(opener)
+    guesses = 1
+    while True:
+        if answer not in lexicon.words:
+            raise ValueError(f"{answer} was filtered out during play")
+        guess = lexicon.sample(LetterFrequencyWordSelectStrategy(lexicon.frequencies))
+        guesses += 1
+        if guess == answer:
+            return guesses
+        guess_filter = WordleGuessFilterStrategy(
+            CompactWordleGuess.from_answer(guess, answer)
+        )
+        lexicon.filter(guess_filter)
+        lexicon.discard(guess)
+
+
+def load_words(file_path: str) -> List[str]:
+    """Loads a sorted list of Wordle-length words.
+
+    :param file_path: path to file with one word per line
+    :return: the words in the file
+    """
+    lexicon = EnglishLexicon.from_file(file_path)
+    lexicon.filter(LengthFilterStrategy(WORD_LENGTH))
+    return sorted(lexicon.words)
+
+
+def shard_path(directory: str, shard: int) -> str:
+    """Determines where the results of a shard are saved.
+
+    :param directory: directory for the job
+    :param shard: index of the shard
+    :return: path of the shard's results
+    """
+    return path.join(directory, f"shard-{shard:05d}.json")
+
+
+def write_json(file_path: str, content: Any) -> None:
+    """Atomically writes JSON, so readers never see partial files.
+
+    :param file_path: where to write
+    :param content: JSON-serializable content
+    :return: None
+    """
+    temporary_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump(content, f)
+    os.replace(temporary_path, file_path)
+
+
+def prepare_job(
+    directory: str, openers: Sequence[str], answers: Sequence[str], shard_size: int
+) -> int:
+    """Records the job in its directory, or checks it matches the one recorded.
+
+    :param directory: directory for the job
+    :param openers: every opener to rank
+    :param answers: words which may be the hidden word
+    :param shard_size: number of openers per shard
+    :return: number of shards in the job
+    """
+    words_hash = hashlib.sha256("\n".join([*openers, "", *answers]).encode())
+    job: Dict[str, Any] = {
+        "words_hash": words_hash.hexdigest(),
+        "shard_size": shard_size,
+        "shards": -(-len(openers) // shard_size),
+    }
+    job_path = path.join(directory, JOB_FILE_NAME)
+    os.makedirs(directory, exist_ok=True)
+    if path.exists(job_path):
+        with open(job_path) as f:
+            existing_job = json.load(f)
+        if existing_job != job:
+            raise ValueError(f"{directory} holds a different job: {existing_job}")
+    else:
+        write_json(job_path, job)
+    return job["shards"]
+
+
+def _init_worker(answers: Sequence[str]) -> None:
+    """Sets the words for a worker process.
+
+    :param answers: words which may be the hidden word
+    :return: None
+    """
+    global _answers
+    _answers = tuple(answers)
+
+
+def _run_shard(task: Tuple[str, int, List[str]]) -> Tuple[int, int, float]:
+    """Plays every game for a shard's openers and saves the results.
+
+    :param task: directory for the job, index of the shard and its openers
+    :return: index of the shard, games played and seconds taken
+    """
+    directory, shard, openers = task
+    start = time.perf_counter()
+    results = {}
+    for opener in openers:
+        guesses = [play_game(opener, answer, _answers) for answer in _answers]
+        results[opener] = {
+            "total_guesses": sum(guesses),
+            "failures": sum(g > TOTAL_ATTEMPTS for g in guesses),
+        }
+    seconds = time.perf_counter() - start
+    games = len(openers) * len(_answers)
+    write_json(
+        shard_path(directory, shard),
+        {"games": games, "seconds": seconds, "results": results},
+    )
+    return shard, games, seconds
+
+
+def run(
+    directory: str,
+    openers: Sequence[str],
+    answers: Sequence[str],
+    shard_size: int = 100,
+    processes: Optional[int] = None,
+    worker_index: int = 0,
+    worker_count: int = 1,
+) -> None:
+    """Plays every shard belonging to this worker which is not yet complete.
+
+    :param directory: directory for the job
+    :param openers: every opener to rank
+    :param answers: words which may be the hidden word
+    :param shard_size: number of openers per shard
+    :param processes: number of processes to use, defaulting to one per core
+    :param worker_index: index of this machine among those sharing the job
+    :param worker_count: number of machines sharing the job
+    :return: None
+    """
+    shards = prepare_job(directory, openers, answers, shard_size)
+    tasks = [
+        (directory, shard, list(openers[shard * shard_size : (shard + 1) * shard_size]))
+        for shard in range(worker_index, shards, worker_count)
+        if not path.exists(shard_path(directory, shard))
+    ]
+    logger.info(f"running {len(tasks)} of {shards} shards")
+
+    total_games, total_seconds = 0, 0.0
+    with Pool(processes, initializer=_init_worker, initargs=(answers,)) as pool:
+        for shard, games, seconds in pool.imap_unordered(_run_shard, tasks):
+            total_games, total_seconds = total_games + games, total_seconds + seconds
+            logger.info(
+                f"finished shard {shard} at {games / seconds:.1f} games/s/core "
+                f"({total_games / total_seconds:.1f} overall)"
+            )
+
+
+def merge(directory: str, output_path: str) -> List[Tuple[str, float, int]]:
+    """Merges completed shards into a table ranked by average guesses.
+
+    :param directory: directory for the job
+    :param output_path: where to save the tab-separated table
+    :return: each opener with its average guesses and failures, best first
+    """
+    with open(path.join(directory, JOB_FILE_NAME)) as f:
+        job = json.load(f)
+    missing = [
+        shard
+        for shard in range(job["shards"])
+        if not path.exists(shard_path(directory, shard))
+    ]
+    if missing:
+        raise ValueError(f"{len(missing)} shards are incomplete, e.g. {missing[0]}")
+
+    results: Dict[str, Dict[str, int]] = {}
+    total_games, total_seconds = 0, 0.0
+    for shard in range(job["shards"]):
+        with open(shard_path(directory, shard)) as f:
+            shard_results = json.load(f)
+        results.update(shard_results["results"])
+        total_games += shard_results["games"]
+        total_seconds += shard_results["seconds"]
+    logger.info(
+        f"played {total_games} games at {total_games / total_seconds:.1f} "
+        f"games/s/core"
+    )
+
+    games_per_opener = total_games / len(results)
+    table = sorted(
+        (
+            (opener, result["total_guesses"] / games_per_opener, result["failures"])
+            for opener, result in results.items()
+        ),
+        key=lambda row: (row[1], row[2], row[0]),
+    )
+    with open(output_path, "w") as f:
+        f.write("rank\topener\taverage_guesses\tfailures\n")
+        for rank, (opener, average, failures) in enumerate(table, 1):
+            f.write(f"{rank}\t{opener}\t{average:.4f}\t{failures}\n")
+    return table
+
+
+def main() -> None:
+    """Runs or merges an opener ranking job."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="play incomplete shards")
+    run_parser.add_argument("directory", help="shared directory for shard results")
+    run_parser.add_argument("--shard-size", type=int, default=100)
+    run_parser.add_argument("--processes", type=int, default=None)
+    run_parser.add_argument("--worker-index", type=int, default=0)
+    run_parser.add_argument("--worker-count", type=int, default=1)
+    merge_parser = subparsers.add_parser("merge", help="rank openers from shards")
+    merge_parser.add_argument("directory", help="shared directory for shard results")
+    merge_parser.add_argument("output", help="path of the ranked table")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "run":
+        answers = load_words(SHORT_WORDS_PATH)
+        openers = sorted(set(answers) | set(load_words(LONG_WORDS_PATH)))
+        run(
+            args.directory,
+            openers,
+            answers,
+            args.shard_size,
+            args.processes,
+            args.worker_index,
+            args.worker_count,
+        )
+    else:
+        merge(args.directory, args.output)
+
+
+if __name__ == "__main__":
+    main()
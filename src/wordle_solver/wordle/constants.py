@@ -0,0 +1,7 @@
+"""Constants describing the rules of a Wordle game."""
+
+# Number of attempts in a Wordle game.
+TOTAL_ATTEMPTS: int = 6
+
+# Default word length for Wordle.
+WORD_LENGTH: int = 5
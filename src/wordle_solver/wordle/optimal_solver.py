@@ -0,0 +1,482 @@
+"""Exact search for guessing policies with the fewest expected guesses."""
+
+import hashlib
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from wordle_solver.language.lexicon_strategies import WordSelectStrategy
+from wordle_solver.wordle.constants import TOTAL_ATTEMPTS
+from wordle_solver.wordle.wordle_guess import feedback_pattern
+
+# Cost of a subtree which cannot be solved in the remaining attempts.
+INFINITY: float = float("inf")
+
+
+@dataclass
+class DecisionTree:
+    """A guessing policy for a set of candidate answers."""
+
+    guess: str
+    candidates: Tuple[str, ...]
+    total_guesses: int
+    children: Dict[int, "DecisionTree"] = field(default_factory=dict)
+
+    @property
+    def expected_guesses(self) -> float:
+        """The average number of guesses needed over all candidates.
+
+        :return: expected guesses assuming each candidate is equally likely
+        """
+        return self.total_guesses / len(self.candidates)
+
+    def nodes(self) -> Iterator["DecisionTree"]:
+        """Iterates over every node in the tree, starting with this one.
+
+        :return: iterator of nodes
+        """
+        yield self
+        for child in self.children.values():
+            yield from child.nodes()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the tree into JSON-serializable values.
+
+        :return: nested dictionary representation of the tree
+        """
+        return {
+            "guess": self.guess,
+            "candidates": list(self.candidates),
+            "total_guesses": self.total_guesses,
+            "children": {
+                str(pattern): child.to_dict()
+                for pattern, child in sorted(self.children.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, raw_tree: Dict[str, Any]) -> "DecisionTree":
+        """Creates a tree from the output of to_dict.
+
+        :param raw_tree: nested dictionary representation of a tree
+        :return: the created tree
+        """
+        return cls(
+            raw_tree["guess"],
+            tuple(raw_tree["candidates"]),
+            raw_tree["total_guesses"],
+            {
+                int(pattern): cls.from_dict(child)
+                for pattern, child in raw_tree["children"].items()
+            },
+        )
+
+
+@dataclass
+class TreeProof:
+    """Certificate of a tree's score, obtained by replaying every candidate."""
+
+    guesses_per_answer: Dict[str, int]
+    max_attempts: int
+
+    @property
+    def total_guesses(self) -> int:
+        """The number of guesses needed summed over all candidates.
+
+        :return: total number of guesses
+        """
+        return sum(self.guesses_per_answer.values())
+
+    @property
+    def expected_guesses(self) -> float:
+        """The average number of guesses needed over all candidates.
+
+        :return: expected guesses assuming each candidate is equally likely
+        """
+        return self.total_guesses / len(self.guesses_per_answer)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the proof into JSON-serializable values.
+
+        :return: dictionary representation of the proof
+        """
+        return {
+            "max_attempts": self.max_attempts,
+            "total_guesses": self.total_guesses,
+            "expected_guesses": self.expected_guesses,
+            "guesses_per_answer": dict(sorted(self.guesses_per_answer.items())),
+        }
+
+
+def prove(tree: DecisionTree, max_attempts: int = TOTAL_ATTEMPTS) -> TreeProof:
+    """Plays every candidate through the tree to certify its score.
+
+    :param tree: tree to check
+    :param max_attempts: number of guesses every candidate must be solved within
+    :return: proof of the tree's score
+    """
+    guesses_per_answer: Dict[str, int] = {}
+    for answer in tree.candidates:
+        node, attempts = tree, 1
+        while node.guess != answer:
+            pattern = feedback_pattern(node.guess, answer)
+            if pattern not in node.children:
+                raise ValueError(f"tree has no branch for {answer} after {node.guess}")
+            node, attempts = node.children[pattern], attempts + 1
+            if answer not in node.candidates:
+                raise ValueError(f"{answer} missing from candidates after feedback")
+        if attempts > max_attempts:
+            raise ValueError(f"{answer} needs {attempts}/{max_attempts} guesses")
+        guesses_per_answer[answer] = attempts
+
+    proof = TreeProof(guesses_per_answer, max_attempts)
+    if proof.total_guesses != tree.total_guesses:
+        raise ValueError(
+            f"tree claims {tree.total_guesses} guesses, replay took "
+            f"{proof.total_guesses}"
+        )
+    return proof
+
+
+def save_tree(
+    tree: DecisionTree, file_path: str, max_attempts: int = TOTAL_ATTEMPTS
+) -> None:
+    """Saves a tree along with the proof of its score.
+
+    :param tree: tree to save
+    :param file_path: where to save the tree
+    :param max_attempts: number of guesses every candidate must be solved within
+    :return: None
+    """
+    proof = prove(tree, max_attempts)
+    with open(file_path, "w") as f:
+        json.dump({"tree": tree.to_dict(), "proof": proof.to_dict()}, f)
+
+
+def load_tree(file_path: str) -> DecisionTree:
+    """Loads a tree saved by save_tree, checking its proof again.
+
+    :param file_path: where the tree was saved
+    :return: the loaded tree
+    """
+    with open(file_path) as f:
+        raw = json.load(f)
+    tree = DecisionTree.from_dict(raw["tree"])
+    proof = prove(tree, raw["proof"]["max_attempts"])
+    if proof.total_guesses != raw["proof"]["total_guesses"]:
+        raise ValueError(f"saved proof does not match tree in {file_path}")
+    return tree
+
+
+class OptimalSolver:
+    """Finds guessing policies minimizing the expected number of guesses.
+
+    The search is exhaustive over the allowed guesses, so the resulting trees are
+    optimal with respect to them. Candidate sets are represented as bitsets over
+    the answers, which key a transposition table of already solved subtrees.
+    """
+
+    def __init__(
+        self,
+        answers: Iterable[str],
+        guesses: Optional[Iterable[str]] = None,
+        max_attempts: int = TOTAL_ATTEMPTS,
+    ):
+        """Precomputes feedback between every guess and answer.
+
+        :param answers: words which may be the hidden word
+        :param guesses: extra words which may be guessed (answers always may be)
+        :param max_attempts: number of guesses every answer must be solved within
+        """
+        self.answers: Tuple[str, ...] = tuple(sorted(set(answers)))
+        self.guesses: Tuple[str, ...] = tuple(
+            sorted(set(self.answers) | set(guesses or ()))
+        )
+        self.max_attempts: int = max_attempts
+
+        self._answer_index: Dict[str, int] = {w: i for i, w in enumerate(self.answers)}
+        self._guess_index: Dict[str, int] = {w: i for i, w in enumerate(self.guesses)}
+        word_length = len(self.answers[0]) if self.answers else 0
+        self._solved_pattern: int = 3**word_length - 1
+
+        # Patterns fit in a byte for the usual word length, which saves memory.
+        self._patterns: List[Sequence[int]] = []
+        for guess in self.guesses:
+            row = [feedback_pattern(guess, answer) for answer in self.answers]
+            self._patterns.append(bytes(row) if self._solved_pattern < 256 else row)
+
+        # Maps (candidate bitset, attempts left) to (cost, whether cost is exact,
+        # best guess). Inexact costs are lower bounds from pruned searches.
+        self._table: Dict[Tuple[int, int], Tuple[float, bool, int]] = {}
+        self.nodes_searched: int = 0
+
+    def solve(
+        self, words: Optional[Iterable[str]] = None, attempts: Optional[int] = None
+    ) -> DecisionTree:
+        """Finds an optimal tree for the given candidate answers.
+
+        :param words: candidate answers, defaulting to all answers
+        :param attempts: guesses available, defaulting to max_attempts
+        :return: optimal decision tree
+        """
+        if words is None:
+            words = self.answers
+        unknown = set(words) - set(self._answer_index)
+        if unknown:
+            raise ValueError(f"words are not answers known to solver: {unknown}")
+        indices = tuple(sorted(self._answer_index[word] for word in set(words)))
+        if not indices:
+            raise ValueError("cannot solve an empty set of words")
+        return self._build(indices, self.max_attempts if attempts is None else attempts)
+
+    def _build(self, indices: Tuple[int, ...], attempts: int) -> DecisionTree:
+        """Builds the tree chosen by the search.
+
+        :param indices: indices of candidate answers
+        :param attempts: guesses available
+        :return: optimal decision tree
+        """
+        cost, guess = self._search(indices, self._mask(indices), attempts, INFINITY)
+        if cost == INFINITY:
+            raise ValueError(f"cannot solve {len(indices)} words in {attempts} guesses")
+        children = {
+            pattern: self._build(tuple(bucket), attempts - 1)
+            for pattern, bucket in self._partition(guess, indices).items()
+            if pattern != self._solved_pattern
+        }
+        candidates = tuple(self.answers[i] for i in indices)
+        return DecisionTree(self.guesses[guess], candidates, int(cost), children)
+
+    def _search(
+        self, indices: Tuple[int, ...], mask: int, attempts: int, beta: float
+    ) -> Tuple[float, int]:
+        """Finds the cheapest guess for the candidates.
+
+        :param indices: indices of candidate answers
+        :param mask: bitset of the candidate answers
+        :param attempts: guesses available
+        :param beta: cost at or above which the caller no longer needs an exact cost
+        :return: total guesses and the guess index, where the total is exact if it
+            is below beta and only a lower bound otherwise
+        """
+        # Small subsets have closed form solutions: guess any candidate.
+        size = len(indices)
+        if size <= 2 and attempts >= size:
+            return 2 * size - 1, self._guess_index[self.answers[indices[0]]]
+        if attempts <= 1:
+            return INFINITY, -1
+
+        key = (mask, attempts)
+        if key in self._table:
+            cost, exact, guess = self._table[key]
+            if exact or cost >= beta:
+                return cost, guess
+        self.nodes_searched += 1
+
+        # Order guesses by their lower bounds, skipping those that split the
+        # candidates identically to a guess already considered.
+        options: List[Tuple[float, int]] = []
+        seen_partitions: Set[FrozenSet[Tuple[bool, Tuple[int, ...]]]] = set()
+        for guess in range(len(self.guesses)):
+            buckets = self._partition(guess, indices)
+            if len(buckets) == 1 and self._solved_pattern not in buckets:
+                continue
+            partition = frozenset(
+                (pattern == self._solved_pattern, tuple(bucket))
+                for pattern, bucket in buckets.items()
+            )
+            if partition in seen_partitions:
+                continue
+            seen_partitions.add(partition)
+            options.append((self._bound(buckets, size, attempts), guess))
+        options.sort()
+
+        best_cost, best_guess = INFINITY, -1
+        for bound, guess in options:
+            limit = min(beta, best_cost)
+            if bound >= limit:
+                if bound < best_cost:
+                    best_cost, best_guess = bound, guess
+                break
+
+            # Replace each bucket's lower bound by its cost, largest first, until
+            # the guess is proven to be no better than the limit.
+            cost = bound
+            buckets = self._partition(guess, indices)
+            for pattern, bucket in sorted(buckets.items(), key=lambda b: -len(b[1])):
+                if pattern == self._solved_pattern:
+                    continue
+                child_bound = self._bucket_bound(len(bucket), attempts - 1)
+                child_cost, _ = self._search(
+                    tuple(bucket),
+                    self._mask(bucket),
+                    attempts - 1,
+                    limit - cost + child_bound,
+                )
+                cost += child_cost - child_bound
+                if cost >= limit:
+                    break
+            if cost < best_cost:
+                best_cost, best_guess = cost, guess
+
+        exact = best_cost < beta or best_cost == INFINITY
+        self._table[key] = (best_cost, exact, best_guess)
+        return best_cost, best_guess
+
+    def _partition(
+        self, guess: int, indices: Iterable[int]
+    ) -> DefaultDict[int, List[int]]:
+        """Groups candidates by the feedback they would give for a guess.
+
+        :param guess: index of the guess
+        :param indices: indices of candidate answers
+        :return: candidate indices keyed by feedback pattern
+        """
+        row = self._patterns[guess]
+        buckets: DefaultDict[int, List[int]] = defaultdict(list)
+        for index in indices:
+            buckets[row[index]].append(index)
+        return buckets
+
+    def _bound(self, buckets: Dict[int, List[int]], size: int, attempts: int) -> float:
+        """Lower bound on total guesses when guessing into the given buckets.
+
+        :param buckets: candidate indices keyed by feedback pattern
+        :param size: total number of candidates
+        :param attempts: guesses available, including this one
+        :return: lower bound on total guesses
+        """
+        return size + sum(
+            self._bucket_bound(len(bucket), attempts - 1)
+            for pattern, bucket in buckets.items()
+            if pattern != self._solved_pattern
+        )
+
+    @staticmethod
+    def _bucket_bound(size: int, attempts: int) -> float:
+        """Lower bound on total guesses needed to solve a bucket of candidates.
+
+        At best one candidate is guessed right away and the rest are all
+        distinguished by that guess.
+
+        :param size: number of candidates in the bucket
+        :param attempts: guesses available
+        :return: lower bound on total guesses
+        """
+        if size > attempts and attempts <= 1:
+            return INFINITY
+        return 2 * size - 1
+
+    @staticmethod
+    def _mask(indices: Iterable[int]) -> int:
+        """Converts candidate indices into a bitset.
+
+        :param indices: indices of candidate answers
+        :return: integer with the bit of each index set
+        """
+        mask = 0
+        for index in indices:
+            mask |= 1 << index
+        return mask
+
+
+class DecisionTreeWordSelectStrategy(WordSelectStrategy):
+    """Selects words by following a decision tree.
+
+    Set remaining_attempts before each selection when playing a game, so that
+    nodes planned with more guesses than remain are solved again instead. The
+    tree and solver are hashed once for cache_key, so they must not be replaced.
+    """
+
+    def __init__(
+        self,
+        tree: DecisionTree,
+        solver: Optional[OptimalSolver] = None,
+        max_attempts: int = TOTAL_ATTEMPTS,
+    ):
+        """Indexes the tree by the candidates at each node.
+
+        :param tree: tree to follow
+        :param solver: solver for candidate sets not found in the tree, if any
+        :param max_attempts: guesses the tree was planned with at its root
+        """
+        self.tree: DecisionTree = tree
+        self.solver: Optional[OptimalSolver] = solver
+        self.max_attempts: int = max_attempts
+        self.remaining_attempts: Optional[int] = None
+
+        # Maps candidates to the guess for them and the guesses it was planned with.
+        self._guesses: Dict[FrozenSet[str], Tuple[str, int]] = {}
+        self._index(tree, max_attempts)
+
+        # Hashing the tree takes milliseconds, too long to repeat on every lookup.
+        tree_json = json.dumps(tree.to_dict(), sort_keys=True)
+        solver_params = None
+        if solver is not None:
+            guesses_hash = hashlib.sha256("\n".join(solver.guesses).encode())
+            solver_params = {
+                "guesses_hash": guesses_hash.hexdigest(),
+                "max_attempts": solver.max_attempts,
+            }
+        self._key_params: Dict[str, Any] = {
+            "tree_hash": hashlib.sha256(tree_json.encode()).hexdigest(),
+            "solver": solver_params,
+        }
+
+    def select(self, words: Set[str]) -> str:
+        """Selects the guess the tree makes for the given candidates.
+
+        :param words: a set of words
+        :return: the optimal guess, which need not be in the set
+        """
+        candidates = frozenset(words)
+        attempts = (
+            self.max_attempts
+            if self.remaining_attempts is None
+            else self.remaining_attempts
+        )
+        entry = self._guesses.get(candidates)
+        if entry is None or entry[1] > attempts:
+            if self.solver is None:
+                raise ValueError(
+                    f"tree has no node for {len(words)} candidates in {attempts} guesses"
+                )
+            self._index(self.solver.solve(candidates, attempts), attempts)
+            entry = self._guesses[candidates]
+        return entry[0]
+
+    def cache_key(self) -> str:
+        """Identifies the strategy by its tree, solver and attempts.
+
+        :return: key identifying the strategy
+        """
+        params = {
+            **self._key_params,
+            "max_attempts": self.max_attempts,
+            "remaining_attempts": self.remaining_attempts,
+        }
+        return f"{type(self).__name__}:{json.dumps(params, sort_keys=True)}"
+
+    def _index(self, tree: DecisionTree, attempts: int) -> None:
+        """Records the guess at each node of a tree.
+
+        :param tree: tree to index
+        :param attempts: guesses available at the root of the tree
+        :return: None
+        """
+        self._guesses[frozenset(tree.candidates)] = (tree.guess, attempts)
+        for child in tree.children.values():
+            self._index(child, attempts - 1)
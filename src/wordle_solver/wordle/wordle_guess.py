@@ -1,8 +1,11 @@
 """Representation of a guess in Wordle."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Union
+from weakref import WeakValueDictionary
 
 
 class WordleGuessComponentType(Enum):
@@ -13,6 +16,55 @@ class WordleGuessComponentType(Enum):
     MISPLACED = "?"
 
 
+# Base-3 digit of each component type when feedback is encoded as an integer.
+PATTERN_DIGITS: Dict[WordleGuessComponentType, int] = {
+    WordleGuessComponentType.INCORRECT: 0,
+    WordleGuessComponentType.MISPLACED: 1,
+    WordleGuessComponentType.CORRECT: 2,
+}
+
+
+def feedback_types(guess: str, answer: str) -> List[WordleGuessComponentType]:
+    """Determines the feedback Wordle gives for a guess against an answer.
+
+    Correct letters are matched first, then misplaced letters are assigned left
+    to right while unmatched copies remain in the answer.
+
+    :param guess: the guessed word
+    :param answer: the hidden word, of the same length as the guess
+    :return: the type of each letter in the guess
+    """
+    assert len(guess) == len(answer), f"expected {guess} and {answer} to match"
+    types = [WordleGuessComponentType.INCORRECT] * len(guess)
+    unmatched: Counter = Counter()
+    for i, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            types[i] = WordleGuessComponentType.CORRECT
+        else:
+            unmatched[answer_letter] += 1
+    for i, guess_letter in enumerate(guess):
+        if types[i] != WordleGuessComponentType.CORRECT and unmatched[guess_letter]:
+            types[i] = WordleGuessComponentType.MISPLACED
+            unmatched[guess_letter] -= 1
+    return types
+
+
+def feedback_pattern(guess: str, answer: str) -> int:
+    """Encodes the feedback for a guess as a base-3 integer.
+
+    The type of letter i contributes its digit times 3**i, so a fully correct
+    guess of length n encodes as 3**n - 1.
+
+    :param guess: the guessed word
+    :param answer: the hidden word, of the same length as the guess
+    :return: the encoded feedback
+    """
+    return sum(
+        PATTERN_DIGITS[component_type] * 3**i
+        for i, component_type in enumerate(feedback_types(guess, answer))
+    )
+
+
 @dataclass(frozen=True, eq=True)
 class WordleGuessComponent:
     """Represents a single letter in a guess."""
@@ -43,6 +95,133 @@ class WordleGuess:
             ]
         )
 
+    @classmethod
+    def from_answer(cls, guess: str, answer: str) -> "WordleGuess":
+        """Determines the guess Wordle would report for a hidden answer."""
+        return cls(
+            [
+                WordleGuessComponent(letter, component_type)
+                for letter, component_type in zip(guess, feedback_types(guess, answer))
+            ]
+        )
+
+    def to_user_input(self) -> str:
+        """Formats the guess in the same format as user input."""
+        return " ".join(
+            f"{component.letter}{component.type.value}" for component in self
+        )
+
     def __iter__(self):
         for component in self.components:
             yield component
+
+
+@lru_cache(maxsize=None)
+def _component(
+    letter: str, component_type: WordleGuessComponentType
+) -> WordleGuessComponent:
+    """Shares components between compact guesses, since they are immutable."""
+    return WordleGuessComponent(letter, component_type)
+
+
+# Component type of each base-3 digit, the inverse of PATTERN_DIGITS.
+PATTERN_TYPES: Dict[int, WordleGuessComponentType] = {
+    digit: component_type for component_type, digit in PATTERN_DIGITS.items()
+}
+
+
+class CompactWordleGuess:
+    """A guessed word along with its feedback encoded as a base-3 integer.
+
+    Instances are immutable and interned, so identical feedback on the same word
+    is always the same object, which also makes them cheap dictionary keys.
+    Iterating over one yields the same components as the equivalent WordleGuess.
+    """
+
+    __slots__ = ("word", "pattern", "__weakref__")
+
+    word: str
+    pattern: int
+
+    # Live instances, keyed by word and pattern.
+    _interned: "WeakValueDictionary[Tuple[str, int], CompactWordleGuess]" = (
+        WeakValueDictionary()
+    )
+
+    def __new__(cls, word: str, pattern: int) -> "CompactWordleGuess":
+        """Returns the interned guess for the word and pattern."""
+        key = (word, pattern)
+        guess = cls._interned.get(key)
+        if guess is None:
+            assert 0 <= pattern < 3 ** len(word), f"invalid pattern {pattern}"
+            guess = super().__new__(cls)
+            object.__setattr__(guess, "word", word)
+            object.__setattr__(guess, "pattern", pattern)
+            cls._interned[key] = guess
+        return guess
+
+    @classmethod
+    def from_user_input(cls, user_input: str) -> "CompactWordleGuess":
+        """Determines a guess from the user input."""
+        letters, pattern = [], 0
+        for i, raw_component in enumerate(user_input.split()):
+            assert (
+                len(raw_component) == 2
+            ), f"expected type and letter in {raw_component}"
+            component_type = WordleGuessComponentType(raw_component[1])
+            letters.append(raw_component[0])
+            pattern += PATTERN_DIGITS[component_type] * 3**i
+        return cls("".join(letters), pattern)
+
+    @classmethod
+    def from_answer(cls, guess: str, answer: str) -> "CompactWordleGuess":
+        """Determines the guess Wordle would report for a hidden answer."""
+        return cls(guess, feedback_pattern(guess, answer))
+
+    @classmethod
+    def from_wordle_guess(cls, wordle_guess: WordleGuess) -> "CompactWordleGuess":
+        """Compacts a guess made of components."""
+        return cls(
+            "".join(component.letter for component in wordle_guess),
+            sum(
+                PATTERN_DIGITS[component.type] * 3**i
+                for i, component in enumerate(wordle_guess)
+            ),
+        )
+
+    def to_wordle_guess(self) -> WordleGuess:
+        """Expands the guess into components."""
+        return WordleGuess(list(self))
+
+    def to_user_input(self) -> str:
+        """Formats the guess in the same format as user input."""
+        return " ".join(
+            f"{component.letter}{component.type.value}" for component in self
+        )
+
+    def __iter__(self) -> Iterator[WordleGuessComponent]:
+        pattern = self.pattern
+        for letter in self.word:
+            yield _component(letter, PATTERN_TYPES[pattern % 3])
+            pattern //= 3
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactWordleGuess):
+            return NotImplemented
+        return self.word == other.word and self.pattern == other.pattern
+
+    def __hash__(self) -> int:
+        return hash((self.word, self.pattern))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, int]]:
+        return type(self), (self.word, self.pattern)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.word!r}, {self.pattern})"
+
+
+# Either representation of a guess, which iterate over the same components.
+AnyWordleGuess = Union[WordleGuess, CompactWordleGuess]
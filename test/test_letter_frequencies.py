@@ -0,0 +1,52 @@
+"""Tests for letter frequency tables."""
+
+from collections import Counter
+from unittest import TestCase
+
+from wordle_solver.language.letter_frequencies import LetterFrequencies
+
+
+class TestLetterFrequencies(TestCase):
+    """Makes sure frequency tables are counted and updated correctly."""
+
+    def test_add(self):
+        """Checks that overall counts ignore repeats but positional ones do not."""
+        frequencies = LetterFrequencies(["aab", "abc"])
+        self.assertEqual(frequencies.overall, Counter({"a": 2, "b": 2, "c": 1}))
+        self.assertEqual(frequencies.positional[0], Counter({"a": 2}))
+        self.assertEqual(frequencies.positional[1], Counter({"a": 1, "b": 1}))
+        self.assertEqual(frequencies.positional[2], Counter({"b": 1, "c": 1}))
+
+    def test_subtract(self):
+        """Checks that subtracting words matches recounting the survivors."""
+        frequencies = LetterFrequencies(["aab", "abc", "cab"])
+        frequencies.subtract(["abc"])
+        expected = LetterFrequencies(["aab", "cab"])
+        self.assertEqual(+frequencies.overall, expected.overall)
+        for i in range(3):
+            self.assertEqual(+frequencies.positional[i], expected.positional[i])
+
+    def test_score(self):
+        """Checks that words with common letters score higher."""
+        frequencies = LetterFrequencies(["ab", "ac", "bc"])
+        self.assertEqual(frequencies.score("ab"), 2 + 2 + 2 + 1)
+        self.assertGreater(frequencies.score("ab"), frequencies.score("cb"))
+
+    def test_best_word(self):
+        """Checks the best word matches scoring every word after subtracting."""
+        words = {"ab", "ac", "bc", "ca", "cb"}
+        frequencies = LetterFrequencies(words)
+        self.assertEqual(frequencies.best_word(words), "ac")
+
+        # Scores only drop when subtracting, so stale scores must be rechecked.
+        frequencies.subtract(["ac", "ca"])
+        remaining = {"ab", "bc", "cb", "zz"}
+        expected = min(remaining, key=lambda w: (-frequencies.score(w), w))
+        self.assertEqual(frequencies.best_word(remaining), expected)
+
+        # Adding words raises scores again.
+        frequencies.add(["bb", "bd"])
+        expected = min(remaining, key=lambda w: (-frequencies.score(w), w))
+        self.assertEqual(frequencies.best_word(remaining), expected)
+        with self.assertRaises(ValueError):
+            frequencies.best_word(set())
@@ -4,7 +4,9 @@ from os.path import abspath, dirname
 from pathlib import Path
 from unittest import TestCase
 
+from wordle_solver.language.letter_frequencies import LetterFrequencies
 from wordle_solver.language.lexicon import EnglishLexicon
+from wordle_solver.language.lexicon_strategies import LengthFilterStrategy
 
 
 class TestLexicon(TestCase):
@@ -31,10 +33,19 @@ class TestLexicon(TestCase):
 
     def test_filter(self):
         """Checks that filtering works correctly."""
-        # TODO
+        lexicon = EnglishLexicon({"ab", "ba", "abc"})
+        lexicon.filter(LengthFilterStrategy(2))
+        self.assertEqual(lexicon.words, {"ab", "ba"})
+
+        # Frequencies should match a recount over the remaining words.
+        expected = LetterFrequencies(lexicon.words)
+        self.assertEqual(+lexicon.frequencies.overall, expected.overall)
+        for i in range(len("ab")):
+            self.assertEqual(+lexicon.frequencies.positional[i], expected.positional[i])
 
     def test_discard(self):
         """Validates discarding behavior for lexicons."""
         lexicon = EnglishLexicon({"a", "b"})
         self.assertFalse(lexicon.discard("c"))
         self.assertTrue(lexicon.discard("a"))
+        self.assertEqual(lexicon.frequencies.overall["a"], 0)
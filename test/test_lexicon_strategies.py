@@ -3,15 +3,17 @@
 import random
 from unittest import TestCase
 
+from wordle_solver.language.letter_frequencies import LetterFrequencies
 from wordle_solver.language.lexicon_strategies import (
     CorrectLetterFilterStrategy,
     IncorrectLetterFilterStrategy,
     LengthFilterStrategy,
+    LetterFrequencyWordSelectStrategy,
     MisplacedLetterFilterStrategy,
     RandomWordSelectStrategy,
     WordleGuessFilterStrategy,
 )
-from wordle_solver.wordle.wordle_guess import WordleGuess
+from wordle_solver.wordle.wordle_guess import CompactWordleGuess, WordleGuess
 
 
 class TestWordSelectStrategy(TestCase):
@@ -24,6 +26,28 @@ class TestWordSelectStrategy(TestCase):
         random_word = random_word_select.select(words)
         self.assertIn(random_word, words)
 
+    def test_letter_frequency_word_select_strategy(self):
+        """Tests that the word with the most common letters is selected."""
+        words = {"ab", "ac", "bc", "ca"}
+        frequency_select = LetterFrequencyWordSelectStrategy(LetterFrequencies(words))
+        self.assertEqual(frequency_select.select(words), "ac")
+
+    def test_cache_key(self):
+        """Tests strategies are keyed on class and all parameters."""
+        self.assertEqual(
+            RandomWordSelectStrategy().cache_key(), "RandomWordSelectStrategy:{}"
+        )
+        frequency_select = LetterFrequencyWordSelectStrategy(LetterFrequencies())
+        self.assertEqual(
+            frequency_select.cache_key(), "LetterFrequencyWordSelectStrategy:{}"
+        )
+
+        # Parameters which cannot be part of a key must not be silently dropped.
+        random_word_select = RandomWordSelectStrategy()
+        random_word_select.words = {"a"}  # type: ignore
+        with self.assertRaises(ValueError):
+            random_word_select.cache_key()
+
 
 class TestFilterStrategy(TestCase):
     """Tests strategies for filtering words."""
@@ -70,3 +94,9 @@ class TestFilterStrategy(TestCase):
         filtered = wordle_filter.filter(words)
         result = filtered.pop()
         self.assertEqual(result, "dam")
+
+        # Compact guesses should filter identically.
+        compact_filter = WordleGuessFilterStrategy(
+            CompactWordleGuess.from_wordle_guess(wordle_guess)
+        )
+        self.assertEqual(compact_filter.filter(words), {"dam"})
@@ -0,0 +1,117 @@
+"""Tests for the exact optimal solver."""
+
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from wordle_solver.wordle.optimal_solver import (
+    DecisionTree,
+    DecisionTreeWordSelectStrategy,
+    OptimalSolver,
+    load_tree,
+    prove,
+    save_tree,
+)
+
+# A small set of answers where guessing a non-answer helps.
+ANSWERS = ["bills", "fills", "hills", "kills", "mills", "pills"]
+
+
+class TestOptimalSolver(TestCase):
+    """Makes sure the solver finds optimal trees."""
+
+    def test_solve(self):
+        """Checks trees are optimal with and without extra guesses."""
+        # Guessing answers one at a time costs 1 + 2 + ... + 6 guesses.
+        tree = OptimalSolver(ANSWERS).solve()
+        self.assertEqual(tree.total_guesses, 21)
+        self.assertEqual(prove(tree).total_guesses, 21)
+
+        # A guess containing b, f and h splits the rest in the next two.
+        solver = OptimalSolver(ANSWERS, ["bfhkm", "fkpmb"])
+        tree = solver.solve()
+        self.assertNotIn(tree.guess, ANSWERS)
+        self.assertAlmostEqual(tree.expected_guesses, 2.0)
+        self.assertEqual(solver.solve(["bills"]).total_guesses, 1)
+
+    def test_attempts(self):
+        """Checks running out of attempts is reported."""
+        with self.assertRaises(ValueError):
+            OptimalSolver(ANSWERS, max_attempts=5).solve()
+        with self.assertRaises(ValueError):
+            OptimalSolver(ANSWERS).solve(["words"])
+
+
+class TestDecisionTree(TestCase):
+    """Makes sure trees are exported and checked correctly."""
+
+    def test_round_trip(self):
+        """Checks saving and loading trees preserves them."""
+        tree = OptimalSolver(ANSWERS, ["bfhkm"]).solve()
+        self.assertEqual(DecisionTree.from_dict(tree.to_dict()), tree)
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, "tree.json")
+            save_tree(tree, file_path)
+            self.assertEqual(load_tree(file_path), tree)
+
+    def test_prove(self):
+        """Checks proofs reject trees with wrong scores."""
+        tree = OptimalSolver(ANSWERS).solve()
+        tree.total_guesses -= 1
+        with self.assertRaises(ValueError):
+            prove(tree)
+        tree.total_guesses += 1
+        with self.assertRaises(ValueError):
+            prove(tree, max_attempts=5)
+
+    def test_word_select_strategy(self):
+        """Checks guesses are taken from the tree or solved as needed."""
+        solver = OptimalSolver(ANSWERS, ["bfhkm"])
+        tree = solver.solve()
+        strategy = DecisionTreeWordSelectStrategy(tree)
+        self.assertEqual(strategy.select(set(ANSWERS)), tree.guess)
+        with self.assertRaises(ValueError):
+            strategy.select({"bills", "pills", "mills"})
+        strategy = DecisionTreeWordSelectStrategy(tree, solver)
+        self.assertIn(strategy.select({"bills", "pills", "mills"}), solver.guesses)
+
+    def test_word_select_strategy_attempts(self):
+        """Checks nodes planned with more guesses than remain are solved again."""
+        solver = OptimalSolver(ANSWERS, ["bfhkm"])
+        tree = OptimalSolver(ANSWERS).solve()
+        strategy = DecisionTreeWordSelectStrategy(tree, solver)
+        self.assertIn(strategy.select(set(ANSWERS)), ANSWERS)
+
+        # With only two guesses left, guessing answers one at a time cannot work.
+        strategy.remaining_attempts = 2
+        self.assertEqual(strategy.select(set(ANSWERS)), "bfhkm")
+        strategy = DecisionTreeWordSelectStrategy(tree)
+        strategy.remaining_attempts = 2
+        with self.assertRaises(ValueError):
+            strategy.select(set(ANSWERS))
+
+    def test_cache_key(self):
+        """Checks strategies following different trees get different keys."""
+        tree = OptimalSolver(ANSWERS).solve()
+        other_tree = OptimalSolver(ANSWERS, ["bfhkm"]).solve()
+        self.assertEqual(tree.guess, "bills")
+        self.assertEqual(other_tree.guess, "bfhkm")
+        strategy = DecisionTreeWordSelectStrategy(tree)
+        self.assertEqual(
+            strategy.cache_key(), DecisionTreeWordSelectStrategy(tree).cache_key()
+        )
+        self.assertNotEqual(
+            strategy.cache_key(), DecisionTreeWordSelectStrategy(other_tree).cache_key()
+        )
+        self.assertNotEqual(
+            strategy.cache_key(),
+            DecisionTreeWordSelectStrategy(tree, OptimalSolver(ANSWERS)).cache_key(),
+        )
+
+        # Only the attempts are read per lookup; the tree was hashed up front.
+        key = strategy.cache_key()
+        with patch.object(DecisionTree, "to_dict") as mock_to_dict:
+            strategy.remaining_attempts = 2
+            self.assertNotEqual(strategy.cache_key(), key)
+            mock_to_dict.assert_not_called()
@@ -0,0 +1,70 @@
+"""Tests for the sharded opener ranking job."""
+
+import os
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from wordle_solver.main.rank_openers import (
+    JOB_FILE_NAME,
+    logger,
+    merge,
+    play_game,
+    run,
+    shard_path,
+)
+
+# A small set of answers with known solve lengths.
+ANSWERS = ["bills", "fills", "hills", "kills"]
+
+
+class TestRankOpeners(TestCase):
+    """Makes sure openers are played, sharded and ranked correctly."""
+
+    def setUp(self) -> None:
+        """Ignore logger outputs."""
+        logger.disabled = True
+
+    def test_play_game(self):
+        """Checks games are played until the answer is guessed."""
+        self.assertEqual(play_game("bills", "bills", ANSWERS), 1)
+        self.assertEqual(play_game("bfhkx", "kills", ANSWERS), 2)
+        self.assertGreater(play_game("fills", "kills", ANSWERS), 1)
+
+    def test_run_and_merge(self):
+        """Checks shards are resumed and merged into a ranked table."""
+        openers = ["bfhkx", "bills", "fills", "hills", "kills"]
+        with TemporaryDirectory() as directory:
+            run(directory, openers, ANSWERS, shard_size=2, processes=1)
+            self.assertTrue(
+                all(path.exists(shard_path(directory, i)) for i in range(3))
+            )
+
+            # Only missing shards should be played again.
+            os.remove(shard_path(directory, 1))
+            modified = path.getmtime(shard_path(directory, 0))
+            run(directory, openers, ANSWERS, shard_size=2, processes=1)
+            self.assertTrue(path.exists(shard_path(directory, 1)))
+            self.assertEqual(path.getmtime(shard_path(directory, 0)), modified)
+
+            output_path = path.join(directory, "ranked.tsv")
+            table = merge(directory, output_path)
+            self.assertEqual(table[0], ("bfhkx", 2.0, 0))
+            self.assertEqual(len(table), len(openers))
+            with open(output_path) as f:
+                self.assertEqual(len(f.readlines()), len(openers) + 1)
+
+    def test_job_mismatch(self):
+        """Checks a directory cannot be reused for a different job."""
+        with TemporaryDirectory() as directory:
+            run(directory, ["bills"], ANSWERS, shard_size=1, processes=1)
+            with self.assertRaises(ValueError):
+                run(directory, ["bills"], ANSWERS, shard_size=2, processes=1)
+            self.assertTrue(path.exists(path.join(directory, JOB_FILE_NAME)))
+
+    def test_merge_incomplete(self):
+        """Checks merging fails while shards are missing."""
+        with TemporaryDirectory() as directory:
+            run(directory, ANSWERS, ANSWERS, shard_size=1, worker_count=2, processes=1)
+            with self.assertRaises(ValueError):
+                merge(directory, path.join(directory, "ranked.tsv"))
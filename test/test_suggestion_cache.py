@@ -0,0 +1,149 @@
+"""Tests for the persistent suggestion cache."""
+
+from os import path
+from tempfile import TemporaryDirectory
+from typing import Set
+from unittest import TestCase
+from unittest.mock import patch
+
+from wordle_solver.language.lexicon_strategies import WordSelectStrategy
+from wordle_solver.language.suggestion_cache import (
+    SuggestionCache,
+    history_key,
+    words_key,
+)
+from wordle_solver.wordle.wordle_guess import WordleGuess
+
+
+class FixedWordSelectStrategy(WordSelectStrategy):
+    """Always selects the same word."""
+
+    def __init__(self, word: str):
+        """Sets the word to select."""
+        self.word: str = word
+
+    def select(self, words: Set[str]) -> str:
+        """Selects the fixed word."""
+        return self.word
+
+
+class TestKeys(TestCase):
+    """Makes sure cache keys are canonical."""
+
+    def test_words_key(self):
+        """Checks word list hashes ignore order."""
+        self.assertEqual(words_key(["ab", "cd"]), words_key({"cd", "ab"}))
+        self.assertNotEqual(words_key(["ab"]), words_key(["ab", "cd"]))
+
+    def test_history_key(self):
+        """Checks histories are formatted the same regardless of spacing."""
+        history = [
+            WordleGuess.from_user_input("a!  b$"),
+            WordleGuess.from_user_input("c?"),
+        ]
+        self.assertEqual(history_key(history), "a! b$\nc?")
+
+
+class TestSuggestionCache(TestCase):
+    """Makes sure suggestions are stored, shared and evicted correctly."""
+
+    def setUp(self) -> None:
+        """Creates a directory for the database."""
+        self.directory = TemporaryDirectory()
+        self.file_path = path.join(self.directory.name, "cache.sqlite")
+
+    def tearDown(self) -> None:
+        """Removes the database."""
+        self.directory.cleanup()
+
+    def test_get_put(self):
+        """Checks suggestions are visible to other connections."""
+        with SuggestionCache(self.file_path) as writer, SuggestionCache(
+            self.file_path
+        ) as reader:
+            self.assertIsNone(reader.get("words", "strategy", ""))
+            writer.put("words", "strategy", "", "crane")
+            self.assertEqual(reader.get("words", "strategy", ""), "crane")
+            writer.put("words", "strategy", "", "slate")
+            self.assertEqual(reader.get("words", "strategy", ""), "slate")
+            self.assertIsNone(reader.get("words", "other", ""))
+
+    def test_preload(self):
+        """Checks many suggestions can be loaded at once."""
+        entries = [("words", "strategy", str(i), "crane") for i in range(10)]
+        with SuggestionCache(self.file_path) as cache:
+            self.assertEqual(cache.preload(entries), 10)
+            self.assertEqual(cache.get("words", "strategy", "9"), "crane")
+
+    @patch("wordle_solver.language.suggestion_cache.time")
+    def test_evict(self, mock_time):
+        """Checks expired and excess entries are removed, oldest first."""
+        mock_time.time.return_value = 0.0
+        with SuggestionCache(self.file_path, ttl_seconds=10, max_entries=3) as cache:
+            for i in range(4):
+                mock_time.time.return_value = float(i)
+                cache.put("words", "strategy", str(i), "crane")
+            self.assertEqual(cache.count(), 3)
+            self.assertIsNone(cache.get("words", "strategy", "0"))
+
+            # Expired entries are hidden even before they are removed.
+            mock_time.time.return_value = 11.5
+            self.assertIsNone(cache.get("words", "strategy", "1"))
+            self.assertEqual(cache.count(), 3)
+
+            self.assertEqual(cache.evict(), 1)
+            self.assertEqual(cache.count(), 2)
+            self.assertEqual(cache.get("words", "strategy", "2"), "crane")
+
+    @patch("wordle_solver.language.suggestion_cache.time")
+    def test_evict_on_open(self, mock_time):
+        """Checks limits are applied to entries written with other limits."""
+        mock_time.time.return_value = 0.0
+        with SuggestionCache(self.file_path) as cache:
+            cache.preload(("words", "strategy", str(i), "crane") for i in range(5))
+        with SuggestionCache(self.file_path, max_entries=2) as cache:
+            self.assertEqual(cache.count(), 2)
+        mock_time.time.return_value = 20.0
+        with SuggestionCache(self.file_path, ttl_seconds=10) as cache:
+            self.assertEqual(cache.count(), 0)
+
+    def test_evict_shared(self):
+        """Checks the size limit holds across connections writing in turn."""
+        caches = [SuggestionCache(self.file_path, max_entries=50) for _ in range(4)]
+        try:
+            for i in range(100):
+                for j, cache in enumerate(caches):
+                    cache.put("words", "strategy", f"{i}-{j}", "crane")
+                    self.assertLessEqual(cache.count(), 50)
+            rows = caches[0].connection.execute("SELECT COUNT(*) FROM suggestions")
+            self.assertEqual(rows.fetchone()[0], 50)
+            self.assertEqual(caches[0].get("words", "strategy", "99-3"), "crane")
+        finally:
+            for cache in caches:
+                cache.close()
+
+    def test_suggest(self):
+        """Checks strategies are only used on a miss."""
+        words = {"crane", "slate"}
+        history = [WordleGuess.from_user_input("a! b! c! d! e!")]
+        with SuggestionCache(self.file_path) as cache:
+            strategy = FixedWordSelectStrategy("crane")
+            self.assertEqual(cache.suggest("words", strategy, history, words), "crane")
+            with patch.object(FixedWordSelectStrategy, "select") as mock_select:
+                cache.suggest("words", strategy, history, words)
+                mock_select.assert_not_called()
+            strategy.word = "slate"
+            self.assertEqual(cache.suggest("words", strategy, history, words), "slate")
+
+            # Changing the strategy's parameters changes its key, so the old
+            # suggestion is still cached under the original parameters.
+            key = 'FixedWordSelectStrategy:{"word": "crane"}'
+            self.assertEqual(cache.get("words", key, "a! b! c! d! e!"), "crane")
+
+    def test_suggest_uncacheable(self):
+        """Checks strategies without a complete key are refused."""
+        strategy = FixedWordSelectStrategy("crane")
+        strategy.word = {"crane"}  # type: ignore
+        with SuggestionCache(self.file_path) as cache:
+            with self.assertRaises(ValueError):
+                cache.suggest("words", strategy, [], {"crane"})
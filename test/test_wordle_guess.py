@@ -1,13 +1,39 @@
 """Tests for core components which make a Wordle guess."""
 
+import pickle
 from unittest import TestCase
 
 from wordle_solver.wordle.wordle_guess import (
+    CompactWordleGuess,
     WordleGuess,
     WordleGuessComponent,
     WordleGuessComponentType,
+    feedback_pattern,
+    feedback_types,
 )
 
+# Shorthand for component types when checking feedback.
+C = WordleGuessComponentType.CORRECT
+X = WordleGuessComponentType.INCORRECT
+M = WordleGuessComponentType.MISPLACED
+
+
+class TestFeedback(TestCase):
+    """Makes sure feedback for guesses matches Wordle's rules."""
+
+    def test_feedback_types(self):
+        """Checks repeated letters are only marked while copies remain."""
+        self.assertEqual(feedback_types("abc", "abc"), [C, C, C])
+        self.assertEqual(feedback_types("abc", "cab"), [M, M, M])
+        self.assertEqual(feedback_types("aab", "bca"), [M, X, M])
+        self.assertEqual(feedback_types("aab", "cad"), [X, C, X])
+
+    def test_feedback_pattern(self):
+        """Checks feedback is encoded as base-3 digits."""
+        self.assertEqual(feedback_pattern("abc", "abc"), 26)
+        self.assertEqual(feedback_pattern("aab", "bca"), 1 + 0 * 3 + 1 * 9)
+        self.assertEqual(feedback_pattern("xyz", "abc"), 0)
+
 
 class TestWordleGuessComponent(TestCase):
     """Makes sure WordleGuessComponent parsing works."""
@@ -52,6 +78,17 @@ class TestWordleGuess(TestCase):
         result = WordleGuess.from_user_input("a! b$")
         self.assertEqual(result, expected)
 
+    def test_from_answer(self):
+        """Tests that guesses are scored against an answer correctly."""
+        expected = WordleGuess.from_user_input("a? a! b?")
+        result = WordleGuess.from_answer("aab", "bca")
+        self.assertEqual(result, expected)
+
+    def test_to_user_input(self):
+        """Tests that guesses are formatted back into user input."""
+        guess = WordleGuess.from_user_input("a!  b$ c?")
+        self.assertEqual(guess.to_user_input(), "a! b$ c?")
+
     def test_iter(self):
         """Checks that iteration works as expected."""
         component_1 = WordleGuessComponent("a", WordleGuessComponentType.INCORRECT)
@@ -59,3 +96,37 @@ class TestWordleGuess(TestCase):
         expected = [component_1, component_2]
         result = list(WordleGuess(expected))
         self.assertEqual(result, expected)
+
+
+class TestCompactWordleGuess(TestCase):
+    """Makes sure compact guesses are interned and convert losslessly."""
+
+    def test_interning(self):
+        """Checks identical guesses share one object and cannot be changed."""
+        guess = CompactWordleGuess("abc", 7)
+        self.assertIs(CompactWordleGuess("abc", 7), guess)
+        self.assertIs(CompactWordleGuess.from_user_input("a? b$ c!"), guess)
+        self.assertIs(pickle.loads(pickle.dumps(guess)), guess)
+        self.assertIsNot(CompactWordleGuess("abc", 8), guess)
+        self.assertEqual({guess: 1}[CompactWordleGuess.from_answer("abc", "xba")], 1)
+        with self.assertRaises(AttributeError):
+            guess.pattern = 8
+        with self.assertRaises(AssertionError):
+            CompactWordleGuess("abc", 27)
+
+    def test_from_user_input(self):
+        """Tests that user input is parsed and formatted back losslessly."""
+        guess = CompactWordleGuess.from_user_input("a? b$  c!")
+        self.assertEqual(guess.word, "abc")
+        self.assertEqual(guess.pattern, 1 + 2 * 3)
+        self.assertEqual(guess.to_user_input(), "a? b$ c!")
+        with self.assertRaises(ValueError):
+            CompactWordleGuess.from_user_input("a? bc")
+
+    def test_wordle_guess(self):
+        """Tests conversion to and from guesses made of components."""
+        wordle_guess = WordleGuess.from_user_input("a! a$ b?")
+        guess = CompactWordleGuess.from_wordle_guess(wordle_guess)
+        self.assertEqual(guess.to_wordle_guess(), wordle_guess)
+        self.assertEqual(list(guess), list(wordle_guess))
+        self.assertIs(CompactWordleGuess.from_answer("aab", "bax"), guess)